@@ -41,6 +41,21 @@ def find_key(dic, val):
     """return the key of dictionary dic given the value"""
     return [k for k, v in dic.items() if v == val][0]
 
+def _has_common_float_dtype(a, b):
+    '''Returns whether a and b have the same float32 or float64 dtype, element-wise for BlockDataContainers
+
+    These are the inputs sapyb handles with the C library without falling back to numpy.
+    '''
+    dtypes_a = getattr(a, 'dtype', None)
+    dtypes_b = getattr(b, 'dtype', None)
+    if not isinstance(dtypes_a, tuple):
+        dtypes_a = (dtypes_a,)
+    if not isinstance(dtypes_b, tuple):
+        dtypes_b = (dtypes_b,)
+    if dtypes_a != dtypes_b:
+        return False
+    return all(dt in (numpy.float32, numpy.float64) for dt in dtypes_a)
+
 def message(cls, msg, *args):
     msg = "{0}: " + msg
     for i in range(len(args)):
@@ -176,6 +176,7 @@ class PDHG(Algorithm):
         - All the objectives are printed if `verbose=2`, ``pdhg.run(verbose=2)``.
 
         Computing these objectives can be costly, so it is better to compute every some iterations. To do this, use ``update_objective_interval = #number``.
+        To reuse :math:`K^{T}y` in the dual objective, PDHG keeps one extra container of the size of the domain while objectives are evaluated. It is released when ``update_objective_interval <= 0``.
 
 
     - PDHG algorithm can be accelerated if the functions :math:`f^{*}` and/or :math:`g` are strongly convex. In these cases, the step-sizes :math:`\sigma` and :math:`\tau` are updated using the :meth:`update_step_sizes` method. A function :math:`f` is strongly convex with constant :math:`\gamma>0` if
@@ -350,6 +351,10 @@ class PDHG(Algorithm):
         self.y = self.operator.range_geometry().allocate(0)
         self.y_tmp = self.operator.range_geometry().allocate(0)   
 
+        # K^T y of the last update, reused by update_objective
+        self._adjoint_y = None
+        self._adjoint_y_current = False
+
         # relaxation parameter, default value is 1.0
         self.theta = kwargs.get('theta',1.0)
           
@@ -391,9 +396,22 @@ class PDHG(Algorithm):
         self.f.proximal_conjugate(self.y_tmp, self.sigma, out=self.y)
 
         # Gradient descent for the primal variable
-        self.operator.adjoint(self.y, out=self.x_tmp)
+        if self.update_objective_interval > 0 and \
+            (self.iteration + 1) % self.update_objective_interval == 0:
+            # the objective is evaluated after this update, keep K^T y
+            if self._adjoint_y is None:
+                self._adjoint_y = self.operator.domain_geometry().allocate(0)
+            self.operator.adjoint(self.y, out=self._adjoint_y)
+            self._adjoint_y_current = True
+
+            self._adjoint_y.sapyb(-self.tau, self.x_old, 1.0 , self.x_tmp)
+        else:
+            self._adjoint_y_current = False
+            if self.update_objective_interval <= 0:
+                self._adjoint_y = None
+            self.operator.adjoint(self.y, out=self.x_tmp)
 
-        self.x_tmp.sapyb(-self.tau, self.x_old, 1.0 , self.x_tmp)
+            self.x_tmp.sapyb(-self.tau, self.x_old, 1.0 , self.x_tmp)
 
         self.g.proximal(self.x_tmp, self.tau, out=self.x)
 
@@ -495,8 +513,13 @@ class PDHG(Algorithm):
         g_eval_p = self.g(self.x_old)
         p1 = f_eval_p + g_eval_p
 
-        self.operator.adjoint(self.y, out=self.x_tmp)
-        self.x_tmp.multiply(-1.0, out=self.x_tmp)
+        if self._adjoint_y_current:
+            # K^T y computed in the last update
+            self._adjoint_y.multiply(-1.0, out=self.x_tmp)
+            self._adjoint_y_current = False
+        else:
+            self.operator.adjoint(self.y, out=self.x_tmp)
+            self.x_tmp.multiply(-1.0, out=self.x_tmp)
 
         f_eval_d = self.f.convex_conjugate(self.y)
         g_eval_d = self.g.convex_conjugate(self.x_tmp)
@@ -20,6 +20,69 @@ import warnings
 from numbers import Number
 import numpy as np
 from functools import reduce
+from weakref import WeakValueDictionary
+from cil.framework.framework import _has_common_float_dtype
+import threading
+try:
+    from numba import jit, prange
+    has_numba = True
+
+    @jit(nopython=True, parallel=True)
+    def _sum_positive(arr):
+        '''Returns the sum of the positive elements of arr in a single parallel pass
+
+        Input arr should be contiguous for best performance'''
+        tmp = arr.ravel()
+        acc = 0.
+        for i in prange(tmp.size):
+            if tmp[i] > 0:
+                acc += tmp[i]
+        return acc
+except ImportError:
+    has_numba = False
+
+# scratch containers shared among the SumFunctions of a thread, one per shape and dtype,
+# released when no SumFunction holds them
+_SCRATCH = threading.local()
+
+def _scratch_cache():
+    '''Returns the scratch cache of the current thread'''
+    try:
+        return _SCRATCH.cache
+    except AttributeError:
+        _SCRATCH.cache = WeakValueDictionary()
+        return _SCRATCH.cache
+
+def _is_compatible(a, b):
+    '''Returns whether container a has the same shape, dtype and geometry as container b'''
+    if hasattr(b, 'containers'):
+        return hasattr(a, 'containers') and len(a.containers) == len(b.containers) and \
+            all(_is_compatible(el_a, el_b) for el_a, el_b in zip(a.containers, b.containers))
+    return a.shape == b.shape and a.dtype == b.dtype and \
+        getattr(a, 'geometry', None) == getattr(b, 'geometry', None)
+
+def _scratch_like(x, previous=None, avoid=None):
+    '''Returns a scratch container compatible with x
+
+    Containers with equal geometry, shape and dtype share one scratch container among the SumFunctions
+    of the current thread. The shared container is not returned if it is x or avoid, which happens when
+    a SumFunction is one of the summands of another SumFunction, or if it belongs to a different geometry
+    of the same shape. In that case previous, the scratch used in the last call, is returned if compatible
+    with x, otherwise a copy of x.
+    '''
+    cache = _scratch_cache()
+    key = (x.shape, str(x.dtype))
+    buf = cache.get(key)
+    if buf is not None and buf is not x and buf is not avoid and _is_compatible(buf, x):
+        return buf
+    if previous is not None and previous is not x and previous is not avoid and \
+        _is_compatible(previous, x):
+        ret = previous
+    else:
+        ret = x.copy()
+    if buf is None:
+        cache[key] = ret
+    return ret
 
 class Function(object):
     
@@ -81,25 +144,33 @@ class Function(object):
         .. math:: \mathrm{prox}_{\tau F^{*}}(x) = x - \tau\mathrm{prox}_{\tau^{-1} F}(\tau^{-1}x)
                 
         """
+        # multiply by the reciprocal rather than dividing elementwise
+        inv_tau = 1.0/tau
         try:
             tmp = x
-            x.divide(tau, out = tmp)
+            if isinstance(tau, Number):
+                x.multiply(inv_tau, out = tmp)
+            else:
+                x.divide(tau, out = tmp)
         except TypeError:
             tmp = x.divide(tau, dtype=np.float32)
 
         if out is None:
-            val = self.proximal(tmp, 1.0/tau)
+            val = self.proximal(tmp, inv_tau)
         else:            
-            self.proximal(tmp, 1.0/tau, out = out)
+            self.proximal(tmp, inv_tau, out = out)
             val = out
                    
         if id(tmp) == id(x):
             x.multiply(tau, out = x)
 
-        # CIL issue #1078, cannot use axpby
-        # val.axpby(-tau, 1.0, x, out=val)
-        val.multiply(-tau, out = val)
-        val.add(x, out = val)
+        if _has_common_float_dtype(val, x):
+            # single pass val = -tau * val + x with the C library
+            val.sapyb(-tau, x, 1.0, out=val)
+        else:
+            # CIL issue #1078, cannot use axpby
+            val.multiply(-tau, out = val)
+            val.add(x, out = val)
 
         if out is None:
             return val
@@ -202,6 +273,13 @@ class SumFunction(Function):
 
     >>> F = SumFunction(*[L2NormSquared(b=i) for i in range(50)])
 
+    Note
+    ----
+    When :code:`gradient` is called with :code:`out`, the gradients of the summands are accumulated through
+    a scratch container. SumFunctions of the same thread share one scratch container for outputs with equal
+    geometry, shape and dtype; each thread has its own. The sharing is not reentrant: the gradient of a summand,
+    writing into the shared container as its :code:`out`, must not store partial results in :code:`out` before
+    calling the gradient of another SumFunction with the same geometry, as that may use the container as scratch.
 
     """
     
@@ -211,6 +289,8 @@ class SumFunction(Function):
         if len(functions) < 2:
             raise ValueError('At least 2 functions need to be passed')
         self.functions = functions
+        # scratch buffer for the gradient with out, allocated on first use
+        self._tmp = None
         
     @property
     def L(self):
@@ -294,11 +374,16 @@ class SumFunction(Function):
                     ret += f.gradient(x)
             return ret
         else:
+            if x is out:
+                # the first gradient overwrites out, keep the input
+                x = x.copy()
+            self._tmp = _scratch_like(out, self._tmp, avoid=x)
             for i,f in enumerate(self.functions):
                 if i == 0:
                     f.gradient(x, out=out)
                 else:
-                    out += f.gradient(x)
+                    f.gradient(x, out=self._tmp)
+                    out.add(self._tmp, out=out)
 
     def __add__(self, other):
         
@@ -344,6 +429,9 @@ class ScaledFunction(Function):
         
         self.scalar = scalar
         self.function = function       
+        # whether the function provides its own proximal_conjugate, e.g. a closed form
+        self._has_proximal_conjugate = \
+            type(function).proximal_conjugate is not Function.proximal_conjugate
     @property
     def L(self):
         if self._L is None:
@@ -366,6 +454,13 @@ class ScaledFunction(Function):
             self._scalar = value
         else:
             raise TypeError('Expecting scalar type as a number type. Got {}'.format(type(value)))
+    def __rmul__(self, scalar):
+        r'''Returns the scaled function multiplied by a scalar, as a single ScaledFunction
+
+        .. math:: \beta (\alpha F) = (\beta\alpha) F
+        '''
+        return ScaledFunction(self.function, scalar * self.scalar)
+
     def __call__(self,x, out=None):
         r"""Returns the value of the scaled function.
         
@@ -419,10 +514,41 @@ class ScaledFunction(Function):
 
     def proximal_conjugate(self, x, tau, out = None):
         r"""This returns the proximal operator for the function at x, tau
+
+        If the scalar is positive and the function provides its own proximal_conjugate, this is used via
+        
+        .. math:: \mathrm{prox}_{\tau G^{*}}(x) = \alpha \mathrm{prox}_{(\tau/\alpha) F^{*}}(\frac{x}{\alpha})
+
+        otherwise Moreau's identity is applied to the proximal of the function.
         """
+        if self._has_proximal_conjugate and self.scalar > 0:
+            try:
+                tmp = x
+                x.multiply(1.0/self.scalar, out = tmp)
+            except TypeError:
+                tmp = x.divide(self.scalar, dtype=np.float32)
+
+            if out is None:
+                val = self.function.proximal_conjugate(tmp, tau/self.scalar)
+            else:
+                self.function.proximal_conjugate(tmp, tau/self.scalar, out = out)
+                val = out
+
+            if id(tmp) == id(x):
+                x.multiply(self.scalar, out = x)
+
+            val.multiply(self.scalar, out = val)
+
+            if out is None:
+                return val
+            return
+
         try:
             tmp = x
-            x.divide(tau, out = tmp)
+            if isinstance(tau, Number):
+                x.multiply(1.0/tau, out = tmp)
+            else:
+                x.divide(tau, out = tmp)
         except TypeError:
             tmp = x.divide(tau, dtype=np.float32)
 
@@ -435,10 +561,13 @@ class ScaledFunction(Function):
         if id(tmp) == id(x):
             x.multiply(tau, out = x)
 
-        # CIL issue #1078, cannot use axpby
-        #val.axpby(-tau, 1.0, x, out=val)
-        val.multiply(-tau, out = val)
-        val.add(x, out = val)
+        if _has_common_float_dtype(val, x):
+            # single pass val = -tau * val + x with the C library
+            val.sapyb(-tau, x, 1.0, out=val)
+        else:
+            # CIL issue #1078, cannot use axpby
+            val.multiply(-tau, out = val)
+            val.add(x, out = val)
 
         if out is None:
             return val
@@ -464,6 +593,24 @@ class SumScalarFunction(SumFunction):
         super(SumScalarFunction, self).__init__(function, ConstantFunction(constant))        
         self.constant = constant
         self.function = function
+
+    def __call__(self, x):
+
+        r"""Returns the value of :math:`F+scalar` at x
+
+        .. math:: (F+scalar)(x) = F(x) + scalar
+
+        """
+        return self.function(x) + self.constant
+
+    def gradient(self, x, out=None):
+
+        r"""Returns the gradient of :math:`F+scalar` at x, which is the gradient of F
+
+        .. math:: (F+scalar)'(x) = F'(x)
+
+        """
+        return self.function.gradient(x, out=out)
         
     def convex_conjugate(self,x):
         
@@ -543,6 +690,10 @@ class ConstantFunction(Function):
         .. math:: F^{*}(x^{*}) = \sum \max\{x^{*}, 0\}
         
         """               
+        if has_numba and hasattr(x, 'as_array'):
+            arr = x.as_array()
+            if not np.iscomplexobj(arr):
+                return _sum_positive(arr)
         return x.maximum(0).sum()
                 
     def proximal(self, x, tau, out=None):
@@ -50,6 +50,26 @@ try:
             
             tmp[i] = el / a 
         return 0
+
+    @numba.jit(nopython=True, parallel=True)
+    def _proximal_conjugate_step_numba(arr):
+        '''Numba implementation of a step in the calculation of the proximal conjugate of MixedL21Norm
+
+        Parameters:
+        -----------
+        arr : numpy array, best if contiguous memory. 
+
+        Returns:
+        --------
+        Stores 1/max(arr, 1) in the input array.
+        '''
+        tmp = arr.ravel()
+        for i in numba.prange(tmp.size):
+            if tmp[i] > 1.0:
+                tmp[i] = 1.0 / tmp[i]
+            else:
+                tmp[i] = 1.0
+        return 0
 except ImportError:
     has_numba = False
     
@@ -80,6 +100,21 @@ def _proximal_step_numpy(tmp, tau):
     res.fill(resarray)
     return res
 
+def _proximal_conjugate_step_numpy(tmp):
+    '''Numpy implementation of a step in the calculation of the proximal conjugate of MixedL21Norm
+
+    Parameters:
+    -----------
+    tmp : DataContainer
+
+    Returns:
+    --------
+    Stores 1/max(tmp, 1) in tmp and returns it.
+    '''
+    tmp.maximum(1.0, out=tmp)
+    tmp.power(-1.0, out=tmp)
+    return tmp
+
 class MixedL21Norm(Function):
     
     
@@ -169,6 +204,35 @@ class MixedL21Norm(Function):
         if out is None:
             return res
 
+    def proximal_conjugate(self, x, tau, out=None):
+
+        r"""Returns the value of the proximal operator of the convex conjugate of the MixedL21Norm function at x.
+
+        This is the projection onto the unit ball of the :math:`\|\cdot\|_{2,\infty}` norm, which does not depend on tau
+
+        .. math :: \mathrm{prox}_{\tau F^{*}}(x) = \frac{x}{\max\{ \|x\|_{2}, 1 \}}
+
+        """
+
+        tmp = x.pnorm(2)
+        if has_numba:
+            try:
+                # may involve a copy if the data is not contiguous
+                tmparr = np.asarray(tmp.as_array(), order='C', dtype=tmp.dtype)
+                if _proximal_conjugate_step_numba(tmparr) != 0:
+                    # if numba silently crashes
+                    raise RuntimeError('MixedL21Norm.proximal_conjugate: numba silently crashed.')
+                tmp.fill(tmparr)
+            except:
+                tmp = _proximal_conjugate_step_numpy(x.pnorm(2))
+        else:
+            tmp = _proximal_conjugate_step_numpy(tmp)
+
+        if out is None:
+            return x.multiply(tmp)
+        else:
+            x.multiply(tmp, out=out)
+
 class SmoothMixedL21Norm(Function):
     
     """ SmoothMixedL21Norm function: :math:`F(x) = ||x||_{2,1} = \sum |x|_{2} = \sum \sqrt{ (x^{1})^{2} + (x^{2})^{2} + \epsilon^2 + \dots}`                  
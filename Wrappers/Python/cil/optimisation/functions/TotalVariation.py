@@ -54,6 +54,8 @@ class TotalVariation(Function):
       :type split: bool, default `False`           
       :param info: force a print to screen stating the stop
       :type info: bool, default `False`
+      :param warm_start: start the FGP iterations from the dual variable of the previous call to proximal
+      :type warm_start: bool, default `False`
 
       :Example:
  
@@ -81,7 +83,8 @@ class TotalVariation(Function):
                  upper = np.inf,
                  isotropic = True,
                  split = False,
-                 info = False):
+                 info = False,
+                 warm_start = False):
         
 
         super(TotalVariation, self).__init__(L = None)
@@ -120,6 +123,10 @@ class TotalVariation(Function):
         # splitting Gradient
         self.split = split
 
+        # warm start of the FGP iterations
+        self.warm_start = warm_start
+        self._p2 = None
+
     @property
     def regularisation_parameter(self):
         return self._regularisation_parameter
@@ -196,7 +203,10 @@ class TotalVariation(Function):
         
         # initialise
         t = 1        
-        tmp_p = self.gradient.range_geometry().allocate(0)  
+        if self.warm_start and self._p2 is not None:
+            tmp_p = self._p2
+        else:
+            tmp_p = self.gradient.range_geometry().allocate(0)  
         tmp_q = tmp_p.copy()
         tmp_x = self.gradient.domain_geometry().allocate(0)     
         p1 = self.gradient.range_geometry().allocate(0)
@@ -208,8 +218,8 @@ class TotalVariation(Function):
             t0 = t
             self.gradient.adjoint(tmp_q, out = tmp_x)
             
-            # axpby now works for matrices
-            tmp_x.axpby(-self.regularisation_parameter*tau, 1.0, x, out=tmp_x)
+            # sapyb works for matrices
+            tmp_x.sapyb(-self.regularisation_parameter*tau, x, 1.0, out=tmp_x)
             self.projection_C(tmp_x, out = tmp_x)                       
 
             self.gradient.direct(tmp_x, out=p1)
@@ -254,6 +264,10 @@ class TotalVariation(Function):
         #clear preallocated projection_P arrays
         self.pptmp = None
         self.pptmp1 = None
+
+        # keep the dual variable for the next call
+        if self.warm_start:
+            self._p2 = tmp_p
         
         # Print stopping information (iterations and tolerance error) of FGP_TV     
         if self.info:
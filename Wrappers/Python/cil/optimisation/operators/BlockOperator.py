@@ -19,7 +19,9 @@ import numpy
 import functools
 from cil.framework import ImageData, BlockDataContainer, DataContainer
 from cil.optimisation.operators import Operator, LinearOperator
+from cil.optimisation.operators.IdentityOperator import IdentityOperator, _ScaledIdentityOperator
 from cil.framework import BlockGeometry
+from cil.framework.framework import _has_common_float_dtype
 try:
     from sirf import SIRF
     from sirf.SIRF import DataContainer as SIRFDataContainer
@@ -180,19 +182,25 @@ class BlockOperator(Operator):
                 
         else:
             
-            tmp = self.range_geometry().allocate()
+            tmp = None
             for row in range(self.shape[0]):
                 for col in range(self.shape[1]):
+                    op = self.get_item(row,col)
                     if col == 0:       
-                        self.get_item(row,col).direct(
-                                                      x_b.get_item(col),
-                                                      out=out.get_item(row))                        
+                        op.direct(x_b.get_item(col), out=out.get_item(row))                        
                     else:
                         a = out.get_item(row)
-                        self.get_item(row,col).direct(
-                                                      x_b.get_item(col), 
-                                                      out=tmp.get_item(row))
-                        a += tmp.get_item(row)
+                        # (scaled) identities are accumulated directly without a temporary
+                        if isinstance(op, IdentityOperator):
+                            a.add(x_b.get_item(col), out=a)
+                        elif isinstance(op, _ScaledIdentityOperator) and \
+                            _has_common_float_dtype(a, x_b.get_item(col)):
+                            a.sapyb(1.0, x_b.get_item(col), op.scalar, out=a)
+                        else:
+                            if tmp is None:
+                                tmp = self.range_geometry().allocate()
+                            op.direct(x_b.get_item(col), out=tmp.get_item(row))
+                            a += tmp.get_item(row)
                 
     def adjoint(self, x, out=None):
         '''Adjoint operation for the BlockOperator
@@ -15,7 +15,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from cil.optimisation.operators import LinearOperator
+from cil.optimisation.operators import LinearOperator, ScaledOperator
 import scipy.sparse as sp
 import numpy as np
 
@@ -63,6 +63,12 @@ class IdentityOperator(LinearOperator):
         '''Evaluates operator norm of IdentityOperator'''        
         
         return 1.0
+
+    def __rmul__(self, scalar):
+        '''Defines the multiplication by a scalar on the left
+
+        returns a ScaledOperator which applies the scalar in a single pass, e.g. -IdentityOperator'''
+        return _ScaledIdentityOperator(self, scalar)
     
     
     ###########################################################################
@@ -81,3 +87,22 @@ class IdentityOperator(LinearOperator):
         return self.gm_domain.allocate(1)
     
     
+
+
+class _ScaledIdentityOperator(ScaledOperator):
+
+    '''ScaledOperator of an IdentityOperator: sop(x) = scalar * x
+
+    direct and adjoint multiply the input by the scalar into out, rather than copying and then scaling.
+    '''
+
+    def direct(self, x, out=None):
+        '''direct method'''
+        if out is None:
+            return x.multiply(self.scalar)
+        else:
+            x.multiply(self.scalar, out=out)
+
+    def adjoint(self, x, out=None):
+        '''adjoint method'''
+        return self.direct(x, out=out)
@@ -16,6 +16,7 @@
 #   limitations under the License.
 
 import unittest
+import warnings
 from cil.framework import ImageGeometry, BlockGeometry, VectorGeometry, ImageData, BlockDataContainer, DataContainer
 from cil.optimisation.operators import BlockOperator,\
     FiniteDifferenceOperator, SymmetrisedGradientOperator
@@ -23,7 +24,7 @@ import numpy
 from timeit import default_timer as timer
 from cil.optimisation.operators import GradientOperator, IdentityOperator,\
     DiagonalOperator, MaskOperator, ChannelwiseOperator, BlurringOperator
-from cil.optimisation.operators import LinearOperator, MatrixOperator
+from cil.optimisation.operators import LinearOperator, MatrixOperator, ScaledOperator
 import numpy   
 from cil.optimisation.operators import SumOperator,  ZeroOperator, CompositionOperator, ProjectionMap
 
@@ -111,6 +112,17 @@ class TestOperator(CCPiTestClass):
         scalar = 0.5
         sid = scalar * IdentityOperator(ig)
         numpy.testing.assert_array_equal(scalar * img.as_array(), sid.direct(img).as_array())
+
+        # negated identity
+        img = ig.allocate('random', seed=1)
+        nid = - IdentityOperator(ig)
+        self.assertIsInstance(nid, ScaledOperator)
+        out = ig.allocate(3)
+        nid.direct(img, out=out)
+        numpy.testing.assert_array_equal(-1 * img.as_array(), out.as_array())
+        nid.adjoint(img, out=out)
+        numpy.testing.assert_array_equal(-1 * img.as_array(), out.as_array())
+        numpy.testing.assert_array_equal(-1 * img.as_array(), nid.adjoint(img).as_array())
     
     def test_DiagonalOperator(self):
         print ("test_DiagonalOperator")
@@ -888,6 +900,32 @@ class TestBlockOperator(unittest.TestCase):
         u1 = B.adjoint(w)
         self.assertAlmostEqual((w * w1).sum() , (u1*u).sum(), places=5)
 
+    def test_BlockOperator_identities_out(self):
+        ig = ImageGeometry(3, 4)
+        Id = IdentityOperator(ig)
+        D = DiagonalOperator(ig.allocate(2.))
+
+        B = BlockOperator(Id, -Id, Id, D, shape=(2,2))
+        u = ig.allocate('random', seed=2)
+        v = ig.allocate('random', seed=3)
+        x = BlockDataContainer(u, v)
+
+        out = B.range_geometry().allocate(1)
+        B.direct(x, out=out)
+        numpy.testing.assert_allclose(out[0].as_array(), (u - v).as_array(), rtol=1e-6, atol=1e-6)
+        numpy.testing.assert_allclose(out[1].as_array(), (u + 2 * v).as_array(), rtol=1e-6, atol=1e-6)
+        numpy.testing.assert_allclose(out[0].as_array(), B.direct(x)[0].as_array(), rtol=1e-6, atol=1e-6)
+
+        # float64 input into a float32 output does not go through sapyb
+        ig64 = ImageGeometry(3, 4, dtype=numpy.float64)
+        x64 = BlockDataContainer(ig64.allocate('random', seed=2), ig64.allocate('random', seed=3))
+        out = B.range_geometry().allocate(1)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            B.direct(x64, out=out)
+        numpy.testing.assert_allclose(out[0].as_array(), (u - v).as_array(), rtol=1e-6, atol=1e-6)
+        numpy.testing.assert_allclose(out[1].as_array(), (u + 2 * v).as_array(), rtol=1e-6, atol=1e-6)
+
 class TestOperatorCompositionSum(unittest.TestCase):
     def setUp(self):
         
@@ -18,10 +18,12 @@
 from cil.optimisation.functions import L1Norm, ScaledFunction, SumFunction,\
                                         LeastSquares, L2NormSquared, \
                                         KullbackLeibler, ZeroFunction, ConstantFunction
+from cil.optimisation.functions import OperatorCompositionFunction
 from cil.optimisation.operators import IdentityOperator                                        
 from cil.framework import ImageGeometry, DataContainer
 
 import unittest
+import threading
 import numpy
 import numpy as np
 from numbers import Number
@@ -254,7 +256,76 @@ class TestFunction(unittest.TestCase):
        # test if the sum remains a SumFunction
         self.assertIsInstance(F3, SumFunction)        
 
-
+    def test_SumFunction_gradient_geometries(self):
+
+        F = SumFunction(self.f1, self.f3)
+
+        # same SumFunction called with out of different geometries
+        for ig in [ImageGeometry(3,4), ImageGeometry(5,6), ImageGeometry(5,6,dtype=np.float64)]:
+            x = ig.allocate('random', seed=4)
+            out = ig.allocate(0)
+            F.gradient(x, out=out)
+            res = self.f1.gradient(x) + self.f3.gradient(x)
+            np.testing.assert_allclose(out.as_array(), res.as_array(), rtol=1e-6)
+            assert F._tmp.shape == out.shape
+            assert F._tmp.dtype == out.dtype
+
+    def test_SumFunction_gradient_shared_scratch(self):
+
+        F1 = SumFunction(self.f1, self.f5)
+        F2 = SumFunction(self.f3, self.f9)
+
+        # different out containers with equal geometry
+        out1 = self.ig.allocate(0)
+        out2 = self.ig.allocate(0)
+        F1.gradient(self.x, out=out1)
+        F2.gradient(self.x, out=out2)
+        np.testing.assert_allclose(out1.as_array(), F1.gradient(self.x).as_array(), rtol=1e-6)
+        np.testing.assert_allclose(out2.as_array(), F2.gradient(self.x).as_array(), rtol=1e-6)
+        # share the scratch container
+        assert F1._tmp is F2._tmp
+
+        # a different geometry with the same shape does not share it
+        ig = self.ig.copy()
+        ig.voxel_size_x = 2.
+        out3 = ig.allocate(0)
+        F3 = SumFunction(self.f1, self.f3)
+        F3.gradient(self.x, out=out3)
+        assert F3._tmp is not F1._tmp
+        assert F3._tmp.geometry == ig
+
+        # the nested SumFunction gets the shared container as out and uses its own scratch
+        F4 = SumFunction(F1, F2)
+        F4.gradient(self.x, out=out1)
+        res = F1.gradient(self.x) + F2.gradient(self.x)
+        np.testing.assert_allclose(out1.as_array(), res.as_array(), rtol=1e-6)
+        assert F4._tmp is F1._tmp
+        assert F2._tmp is not F4._tmp
+
+        # nested composite: the inner SumFunction runs while the shared container is the out of the summand
+        C = OperatorCompositionFunction(SumFunction(self.f1, self.f3), IdentityOperator(self.ig))
+        F5 = SumFunction(self.f5, C)
+        F5.gradient(self.x, out=out1)
+        res = self.f5.gradient(self.x) + self.f1.gradient(self.x) + self.f3.gradient(self.x)
+        np.testing.assert_allclose(out1.as_array(), res.as_array(), rtol=1e-6)
+        assert F5._tmp is F1._tmp
+        assert C.function._tmp is F1._tmp
+
+    def test_SumFunction_gradient_scratch_per_thread(self):
+
+        F1 = SumFunction(self.f1, self.f5)
+        F2 = SumFunction(self.f3, self.f9)
+
+        out1 = self.ig.allocate(0)
+        F1.gradient(self.x, out=out1)
+
+        # a SumFunction in another thread does not share the scratch container
+        out2 = self.ig.allocate(0)
+        thread = threading.Thread(target=F2.gradient, args=(self.x,), kwargs={'out': out2})
+        thread.start()
+        thread.join()
+        np.testing.assert_allclose(out2.as_array(), F2.gradient(self.x).as_array(), rtol=1e-6)
+        assert F2._tmp is not F1._tmp
 
     def test_ConstantFunction(self):
 
@@ -271,6 +342,10 @@ class TestFunction(unittest.TestCase):
         self.assertNumpyArrayEqual(numpy.zeros(x.shape), grad.as_array())
         
         self.assertNumpyArrayEqual(out.as_array(), grad.as_array())
+
+        # convex conjugate sums the positive elements
+        y = ig.allocate('random', seed=3) - 0.5
+        np.testing.assert_almost_equal(k.convex_conjugate(y), y.maximum(0).sum(), decimal=5)
                 
     def test_SumFunctionScalar(self):      
         numpy.random.seed(1)
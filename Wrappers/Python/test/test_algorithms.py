@@ -468,6 +468,30 @@ class TestAlgorithms(unittest.TestCase):
         with warnings.catch_warnings(record=True) as wa:
             pdhg = PDHG(f=f, g=g, operator=operator, tau = tau, sigma = sigma, max_iteration=10)  
             assert "Convergence criterion" in str(wa[0].message)             
+
+
+    def test_PDHG_objective_reuses_adjoint(self):
+
+        ig = ImageGeometry(3,3)
+        data = ig.allocate('random', seed=5)
+
+        f = L2NormSquared(b=data)
+        g = L2NormSquared()
+        operator = 3*IdentityOperator(ig)
+
+        for interval in [1, 2]:
+            pdhg = PDHG(f=f, g=g, operator=operator, max_iteration=4, update_objective_interval=interval)
+            pdhg.run(verbose=0)
+
+            # dual objective evaluated from scratch at the last iterate
+            d1 = f.convex_conjugate(pdhg.y) + g.convex_conjugate(-1 * operator.adjoint(pdhg.y))
+            np.testing.assert_almost_equal(pdhg.loss[-1][1], -d1, decimal=5)
+            assert pdhg._adjoint_y_current is False
+
+        # no extra container is kept when objectives are not evaluated
+        pdhg.update_objective_interval = 0
+        pdhg.update()
+        assert pdhg._adjoint_y is None
                   
     def test_PDHG_strongly_convex_gamma_g(self):
 
@@ -31,6 +31,7 @@ from cil.optimisation.functions import Function, KullbackLeibler, WeightedL2Norm
 from cil.optimisation.functions import BlockFunction                              
 
 import unittest
+import warnings
 import numpy
 import scipy.special
 
@@ -66,9 +67,11 @@ has_numba = True
 try:
     import numba
     # imports the function that uses numba
-    from cil.optimisation.functions.MixedL21Norm import _proximal_step_numba, _proximal_step_numpy
+    from cil.optimisation.functions.MixedL21Norm import _proximal_step_numba, _proximal_step_numpy, \
+        _proximal_conjugate_step_numba
 except ImportError as ie:
     has_numba = False
+from cil.optimisation.functions.MixedL21Norm import _proximal_conjugate_step_numpy
 
 
 class TestFunction(unittest.TestCase):
@@ -148,7 +151,37 @@ class TestFunction(unittest.TestCase):
         # Compare convex conjugate of g
         a3 = 0.5 * d.squared_norm() + d.dot(noisy_data)
         self.assertAlmostEqual(a3, g.convex_conjugate(d), places=7)
+
+        # scaling a scaled function does not nest ScaledFunctions
+        g2 = 3 * g
+        self.assertIsInstance(g2, ScaledFunction)
+        self.assertIsInstance(g2.function, L2NormSquared)
+        self.assertAlmostEqual(g2.scalar, 3 * alpha)
+        self.assertAlmostEqual(g2(d), 3 * g(d), places=5)
+        g3 = g * -1
+        self.assertAlmostEqual(g3.scalar, -alpha)
+
+        # a zero scalar must not raise in the convex conjugate
+        g0 = 0 * L2NormSquared(b=noisy_data)
+        with numpy.errstate(all='ignore'):
+            g0.convex_conjugate(d)
     
+    def test_proximal_conjugate_mixed_dtype(self):
+
+        ig = ImageGeometry(3,4)
+        ig64 = ImageGeometry(3,4, dtype=np.float64)
+        x = ig64.allocate('random', seed=1)
+        out = ig.allocate(0)
+
+        f = L2NormSquared()
+        # out and x of different float types are not handled by the C library,
+        # the update falls back to numpy without warning
+        with warnings.catch_warnings(record=True) as wa:
+            warnings.simplefilter("always")
+            f.proximal_conjugate(x, 0.5, out=out)
+        assert not any("sapyb" in str(w.message) for w in wa)
+        np.testing.assert_allclose(out.as_array(), f.proximal_conjugate(x, 0.5).as_array(), rtol=1e-5)
+
     def test_L2NormSquared(self):
         # TESTS for L2 and scalar * L2
         print ("Test L2NormSquared")
@@ -429,6 +462,40 @@ class TestFunction(unittest.TestCase):
         f_no_scaled.proximal_conjugate(U, 1, out=z3)
         self.assertBlockDataContainerAlmostEqual(z3,z1, decimal=5)
 
+        # closed form projection against Moreau's identity
+        U *= 3
+        z4 = Function.proximal_conjugate(f_no_scaled, U, 0.5)
+        z5 = f_no_scaled.proximal_conjugate(U, 0.5)
+        self.assertBlockDataContainerAlmostEqual(z4,z5, decimal=5)
+
+        # scaled function dispatches to the closed form of the function
+        f_scaled = 2 * MixedL21Norm()
+        z6 = Function.proximal_conjugate(f_scaled, U, 0.5)
+        z7 = f_scaled.proximal_conjugate(U, 0.5)
+        self.assertBlockDataContainerAlmostEqual(z6,z7, decimal=5)
+        f_scaled.proximal_conjugate(U, 0.5, out=z3)
+        self.assertBlockDataContainerAlmostEqual(z6,z3, decimal=5)
+
+
+    @unittest.skipUnless(has_numba, 'Skipping as numba is not installed')
+    def test_MixedL21Norm_proximal_conjugate_step_numba(self):
+        ig = ImageGeometry(10, 11)
+        y = BlockDataContainer(2 * ig.allocate('random', seed=1), 2 * ig.allocate('random', seed=2))
+        arr = y.pnorm(2).as_array()
+        expected = 1 / np.maximum(arr, 1)
+
+        tmp = np.asarray(arr, order='C', dtype=np.float32)
+        self.assertEqual(_proximal_conjugate_step_numba(tmp), 0)
+        np.testing.assert_allclose(tmp, expected, rtol=1e-6)
+
+    def test_MixedL21Norm_proximal_conjugate_step_numpy(self):
+        ig = ImageGeometry(10, 11)
+        y = BlockDataContainer(2 * ig.allocate('random', seed=1), 2 * ig.allocate('random', seed=2))
+        tmp = y.pnorm(2)
+        expected = 1 / np.maximum(tmp.as_array(), 1)
+
+        res = _proximal_conjugate_step_numpy(tmp)
+        np.testing.assert_allclose(res.as_array(), expected, rtol=1e-6)
 
     @unittest.skipUnless(has_numba, 'Skipping as numba is not installed')
     def test_MixedL21Norm_step(self):
@@ -992,6 +1059,27 @@ class TestTotalVariation(unittest.TestCase):
         res1 = self.tv_aniso(x_real)
         res2 = self.grad.direct(x_real).pnorm(1).sum()
         np.testing.assert_equal(res1, res2)                
+
+    def test_warm_start(self):
+
+        x_real = self.ig_real.allocate('random', seed=4)
+
+        tv = TotalVariation(max_iteration=5)
+        tv_warm = TotalVariation(max_iteration=5, warm_start=True)
+
+        # first call is identical, no previous dual variable available
+        res1 = tv.proximal(x_real, tau=0.5)
+        res2 = tv_warm.proximal(x_real, tau=0.5)
+        np.testing.assert_allclose(res1.as_array(), res2.as_array(), rtol=1e-6)
+        assert tv._p2 is None
+        assert tv_warm._p2 is not None
+
+        # warm started calls continue the FGP iterations
+        tv_long = TotalVariation(max_iteration=500)
+        res_long = tv_long.proximal(x_real, tau=0.5)
+        for _ in range(100):
+            tv_warm.proximal(x_real, tau=0.5, out=res2)
+        np.testing.assert_allclose(res2.as_array(), res_long.as_array(), rtol=1e-3, atol=1e-4)
     
     @unittest.skipUnless(has_reg_toolkit, "Regularisation Toolkit not present")
     def test_compare_regularisation_toolkit(self):